@@ -1,51 +1,135 @@
+import argparse
+import os
+import re
+import shutil
 import subprocess
-import dis
-import io
-import contextlib
-import time
+import functools
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import track
 
 console = Console()
 
+_SS_PATH = shutil.which("ss") or next(
+    (p for p in ("/usr/sbin/ss", "/bin/ss", "/usr/bin/ss") if os.path.exists(p)), None
+)
+_SS_NOT_FOUND = "Error: 'ss' command not found. Please install iproute."
+
+_SOCKSTAT_FILES = ("/proc/net/sockstat", "/proc/net/sockstat6")
+_SNMP_FILE = "/proc/net/snmp"
+_SOCKSTAT_RE = re.compile(rb"^(\w+): (.*)$", re.M)
+_SNMP_TCP_RE = re.compile(rb"^Tcp: (.*)\nTcp: (.*)$", re.M)
+
+def _format_sockstat(sockstat, sockstat6, snmp):
+    """Render raw /proc/net/{sockstat,sockstat6,snmp} bytes the way 'ss -s' does.
+
+    Raises ValueError if the input is malformed.
+    """
+    stats = {}
+    for m in _SOCKSTAT_RE.finditer(sockstat + b"\n" + sockstat6):
+        fields = m.group(2).split()
+        stats[m.group(1).decode()] = {
+            key.decode(): int(val) for key, val in zip(fields[::2], fields[1::2])
+        }
+    m = _SNMP_TCP_RE.search(snmp)
+    if m is None:
+        raise ValueError("no Tcp section in snmp data")
+    tcp_snmp = dict(zip(m.group(1).split(), m.group(2).split()))
+    if b"CurrEstab" not in tcp_snmp:
+        raise ValueError("no CurrEstab in snmp data")
+    estab = int(tcp_snmp[b"CurrEstab"])
+
+    def get(proto, key="inuse"):
+        return stats.get(proto, {}).get(key, 0)
+
+    alloc, tw = get("TCP", "alloc"), get("TCP", "tw")
+    closed = alloc - (get("TCP") + get("TCP6") - tw)
+    lines = [
+        f"Total: {get('sockets', 'used')}",
+        f"TCP:   {alloc + tw} (estab {estab}, closed {closed}, "
+        f"orphaned {get('TCP', 'orphan')}, timewait {tw})",
+        "",
+        "Transport Total     IP        IPv6",
+    ]
+    inet4 = inet6 = 0
+    for name in ("RAW", "UDP", "TCP"):
+        ip4, ip6 = get(name), get(name + "6")
+        inet4 += ip4
+        inet6 += ip6
+        lines.append(f"{name}\t  {ip4 + ip6:<9} {ip4:<9} {ip6:<9}")
+    lines.append(f"INET\t  {inet4 + inet6:<9} {inet4:<9} {inet6:<9}")
+    frag4, frag6 = get("FRAG"), get("FRAG6")
+    lines.append(f"FRAG\t  {frag4 + frag6:<9} {frag4:<9} {frag6:<9}")
+    return "\n".join(lines) + "\n\n"
+
+def _read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _read_proc_sockstat():
+    """Build the 'ss -s' summary from /proc, or return None if unavailable."""
+    sockstat_path, sockstat6_path = _SOCKSTAT_FILES
+    try:
+        sockstat = _read_file(sockstat_path)
+        snmp = _read_file(_SNMP_FILE)
+    except OSError:
+        return None
+    try:
+        sockstat6 = _read_file(sockstat6_path)
+    except OSError:
+        sockstat6 = b""  # no IPv6 support
+    try:
+        return _format_sockstat(sockstat, sockstat6, snmp)
+    except ValueError:
+        return None
+
+def _report_error(error_message):
+    console.print(f"[bold red]{error_message}[/bold red]")
+    return error_message
+
 def get_socket_summary():
+    summary = _read_proc_sockstat()
+    if summary is not None:
+        console.print("[bold green]Success! Read socket summary from /proc/net/sockstat.[/bold green]")
+        return summary
+
     console.print("[bold blue]Executing 'ss' command to fetch socket summary...[/bold blue]")
+    if _SS_PATH is None:
+        return _report_error(_SS_NOT_FOUND)
     try:
-        result = subprocess.run(['ss', '-s'], capture_output=True, text=True)
+        result = subprocess.run([_SS_PATH, '-s'], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, close_fds=False)
         console.print("[bold green]Success! Retrieved socket summary.[/bold green]")
-        return result.stdout
+        return result.stdout.decode('ascii', 'replace')
     except subprocess.CalledProcessError as e:
-        error_message = f"Command error: {e}"
-        console.print(f"[bold red]{error_message}[/bold red]")
-        return error_message
+        return _report_error(f"Command error: {e}")
     except FileNotFoundError:
-        error_message = "Error: 'ss' command not found. Please install iproute."
-        console.print(f"[bold red]{error_message}[/bold red]")
-        return error_message
+        return _report_error(_SS_NOT_FOUND)
     except Exception as e:
-        error_message = f"An unexpected error occurred: {e}"
-        console.print(f"[bold red]{error_message}[/bold red]")
-        return error_message
+        return _report_error(f"An unexpected error occurred: {e}")
+
+@functools.lru_cache(maxsize=128)
+def _bytecode_for_code(code):
+    import dis
+    return dis.Bytecode(code).dis()
 
 def get_bytecode(func):
-    buf = io.StringIO()
-    with contextlib.redirect_stdout(buf):
-        dis.dis(func)
-    return buf.getvalue()
+    return _bytecode_for_code(func.__code__)
 
-def print_socket_summary():
+def print_socket_summary(show_bytecode=False):
     console.print(Panel("[bold yellow]Welcome to the Socket Summary Analyzer[/bold yellow]", style="bold magenta"))
-    
-    for _ in track(range(5), description="Preparing cinematic analysis..."):
-        time.sleep(0.1)
-    
+
     socket_summary = get_socket_summary()
+
     console.rule("[bold green]Socket Summary[/bold green]")
     console.print(Panel(socket_summary, title="Socket Details", style="cyan"), justify="center")
-    
-    console.rule("[bold magenta]Bytecode Analysis[/bold magenta]")
-    console.print(get_bytecode(get_socket_summary))
+
+    if show_bytecode:
+        console.rule("[bold magenta]Bytecode Analysis[/bold magenta]")
+        console.print(get_bytecode(get_socket_summary))
 
 if __name__ == "__main__":
-    print_socket_summary()
+    parser = argparse.ArgumentParser(description="Socket Summary Analyzer")
+    parser.add_argument("--bytecode", action="store_true",
+                        help="also show the bytecode of get_socket_summary")
+    args = parser.parse_args()
+    print_socket_summary(show_bytecode=args.bytecode)
@@ -0,0 +1,87 @@
+import dis_sock_info
+
+SOCKSTAT = b"""\
+sockets: used 231
+TCP: inuse 7 orphan 1 tw 3 alloc 9 mem 2
+UDP: inuse 4 mem 1
+UDPLITE: inuse 0
+RAW: inuse 1
+FRAG: inuse 0 memory 0
+"""
+
+SOCKSTAT6 = b"""\
+TCP6: inuse 2
+UDP6: inuse 5
+UDPLITE6: inuse 0
+RAW6: inuse 1
+FRAG6: inuse 0 memory 0
+"""
+
+SNMP = b"""\
+Ip: Forwarding DefaultTTL InReceives
+Ip: 1 64 12345
+Tcp: RtoAlgorithm RtoMin RtoMax MaxConn ActiveOpens PassiveOpens AttemptFails EstabResets CurrEstab InSegs OutSegs RetransSegs InErrs OutRsts InCsumErrors
+Tcp: 1 200 120000 -1 10 8 0 3 5 626 625 0 0 2 0
+Udp: InDatagrams NoPorts
+Udp: 10 0
+"""
+
+# What 'ss -s' prints for the /proc contents above.
+SS_OUTPUT = (
+    "Total: 231\n"
+    "TCP:   12 (estab 5, closed 3, orphaned 1, timewait 3)\n"
+    "\n"
+    "Transport Total     IP        IPv6\n"
+    "RAW\t  2         1         1        \n"
+    "UDP\t  9         4         5        \n"
+    "TCP\t  9         7         2        \n"
+    "INET\t  20        12        8        \n"
+    "FRAG\t  0         0         0        \n"
+    "\n"
+)
+
+SS_OUTPUT_NO_IPV6 = (
+    "Total: 231\n"
+    "TCP:   12 (estab 5, closed 5, orphaned 1, timewait 3)\n"
+    "\n"
+    "Transport Total     IP        IPv6\n"
+    "RAW\t  1         1         0        \n"
+    "UDP\t  4         4         0        \n"
+    "TCP\t  7         7         0        \n"
+    "INET\t  12        12        0        \n"
+    "FRAG\t  0         0         0        \n"
+    "\n"
+)
+
+
+def _write_proc(tmp_path, monkeypatch, sockstat6=SOCKSTAT6, snmp=SNMP):
+    (tmp_path / "sockstat").write_bytes(SOCKSTAT)
+    if sockstat6 is not None:
+        (tmp_path / "sockstat6").write_bytes(sockstat6)
+    (tmp_path / "snmp").write_bytes(snmp)
+    monkeypatch.setattr(dis_sock_info, "_SOCKSTAT_FILES",
+                        (str(tmp_path / "sockstat"), str(tmp_path / "sockstat6")))
+    monkeypatch.setattr(dis_sock_info, "_SNMP_FILE", str(tmp_path / "snmp"))
+
+
+def test_format_sockstat_matches_ss():
+    assert dis_sock_info._format_sockstat(SOCKSTAT, SOCKSTAT6, SNMP) == SS_OUTPUT
+
+
+def test_format_sockstat_without_ipv6():
+    assert dis_sock_info._format_sockstat(SOCKSTAT, b"", SNMP) == SS_OUTPUT_NO_IPV6
+
+
+def test_read_proc_sockstat(tmp_path, monkeypatch):
+    _write_proc(tmp_path, monkeypatch)
+    assert dis_sock_info._read_proc_sockstat() == SS_OUTPUT
+
+
+def test_read_proc_sockstat_missing_sockstat6(tmp_path, monkeypatch):
+    _write_proc(tmp_path, monkeypatch, sockstat6=None)
+    assert dis_sock_info._read_proc_sockstat() == SS_OUTPUT_NO_IPV6
+
+
+def test_read_proc_sockstat_without_snmp_falls_back(tmp_path, monkeypatch):
+    _write_proc(tmp_path, monkeypatch, snmp=b"Ip: Forwarding\nIp: 1\n")
+    assert dis_sock_info._read_proc_sockstat() is None